@@ -0,0 +1,34 @@
+"""Isolated numba imports for ForecastKnownValues."""
+
+__author__ = ["aryan0931"]
+
+from sktime.utils.dependencies import _check_soft_dependencies
+from sktime.utils.numba.njit import njit
+
+if _check_soft_dependencies("numba", severity="none"):
+    from numba import prange
+
+
+@njit(cache=True, parallel=True)
+def _take_with_fill(values, indexer, fill_value, out):
+    """Take rows of values at indexer into out, filling negative indices.
+
+    Parameters
+    ----------
+    values : 2D np.ndarray of shape (n_rows, n_columns)
+        values to take rows from
+    indexer : 1D np.ndarray of int, of length n_out
+        row positions in values, negative entries denote missing rows
+    fill_value : scalar
+        value to write to rows of out with negative indexer entries
+    out : 2D np.ndarray of shape (n_out, n_columns)
+        array to write result to, modified in place
+    """
+    n_columns = values.shape[1]
+    for i in prange(len(indexer)):
+        idx = indexer[i]
+        for j in range(n_columns):
+            if idx < 0:
+                out[i, j] = fill_value
+            else:
+                out[i, j] = values[idx, j]
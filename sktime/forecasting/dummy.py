@@ -3,10 +3,53 @@
 
 __author__ = ["fkiraly"]
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_float,
+    is_integer,
+    is_numeric_dtype,
+)
 
 from sktime.datatypes import convert_to
 from sktime.forecasting.base import BaseForecaster
+from sktime.utils.dependencies import _check_soft_dependencies
+
+# minimum number of predicted values for which the row take is compiled with numba,
+# below this, one-off compilation or cache loading outweighs the gain over numpy
+_NUMBA_MIN_SIZE = 1_000_000
+# value dtypes for which the numba row take is compiled
+_NUMBA_DTYPES = [np.float32, np.float64]
+
+# fill methods that are obtained by a search on the time axis shared by all instances
+_SEARCHSORTED_METHODS = ["pad", "ffill", "backfill", "bfill"]
+
+
+def _is_comparable(index, other):
+    """Check whether the values of two indices can be ordered against each other.
+
+    Mirrors the dtype combinations for which ``pd.Index.get_indexer`` with a fill
+    ``method`` does not raise a ``TypeError``.
+
+    Parameters
+    ----------
+    index, other : pd.Index
+        indices to check
+
+    Returns
+    -------
+    bool, whether values of ``index`` and ``other`` can be compared
+    """
+    dtype, other_dtype = index.dtype, other.dtype
+    if is_numeric_dtype(dtype) and is_numeric_dtype(other_dtype):
+        return True
+    if is_datetime64_any_dtype(dtype) and is_datetime64_any_dtype(other_dtype):
+        # tz-aware and tz-naive timestamps cannot be compared
+        return isinstance(dtype, pd.DatetimeTZDtype) == isinstance(
+            other_dtype, pd.DatetimeTZDtype
+        )
+    return dtype == other_dtype
 
 
 class ForecastKnownValues(BaseForecaster):
@@ -81,10 +124,46 @@ class ForecastKnownValues(BaseForecaster):
 
         PANDAS_DF_TYPES = ["pd.DataFrame", "pd-multiindex", "pd_multiindex_hier"]
 
-        self._y_known = convert_to(y_known, PANDAS_DF_TYPES)
+        # plain pandas objects with flat index need no mtype inference
+        is_pandas = isinstance(y_known, (pd.DataFrame, pd.Series))
+        if is_pandas and not isinstance(y_known.index, pd.MultiIndex):
+            is_series = isinstance(y_known, pd.Series)
+            self._y_known = y_known.to_frame() if is_series else y_known
+        else:
+            self._y_known = convert_to(y_known, PANDAS_DF_TYPES)
+
+        # sorted index allows reindex and get_indexer to use monotonic fast paths
+        if not self._y_known.index.is_monotonic_increasing:
+            self._y_known = self._y_known.sort_index()
+        self._y_known_is_unique = self._y_known.index.is_unique
+
+        # parameters passed on to reindex do not change after construction,
+        # limit is only valid together with a method
+        self._has_fill = fill_value is not None
+        self._reindex_params = {"method": method}
+        if method is not None:
+            self._reindex_params["limit"] = limit
+        if self._has_fill:
+            self._reindex_params["fill_value"] = fill_value
+
+        # if y_known holds a single float dtype and fill_value is numeric,
+        # rows can be played back by an integer take on the values array,
+        # with no change of dtypes compared to reindex
+        dtypes = set(self._y_known.dtypes)
+        fill_is_numeric = not self._has_fill or is_float(fill_value)
+        fill_is_numeric = fill_is_numeric or is_integer(fill_value)
+        self._use_take = fill_is_numeric and len(dtypes) == 1
+        self._use_take = self._use_take and dtypes.pop().kind == "f"
+        if self._use_take:
+            # row-major copy of the values, so taken rows are contiguous blocks
+            self._y_known_values = np.ascontiguousarray(self._y_known.to_numpy())
+            self._y_known_cols = self._y_known.columns
 
         idx = self._y_known.index
-        if isinstance(idx, pd.MultiIndex):
+        self._is_multiindex = isinstance(idx, pd.MultiIndex)
+        self._y_known_time_index = idx.levels[-1] if self._is_multiindex else idx
+        self._time_axis = None
+        if self._is_multiindex:
             if idx.nlevels >= 3:
                 mtypes = ["pd.DataFrame", "pd-multiindex", "pd_multiindex_hier"]
             elif idx.nlevels == 2:
@@ -92,6 +171,29 @@ class ForecastKnownValues(BaseForecaster):
             self.set_tags(**{"y_inner_mtype": mtypes})
             self.set_tags(**{"X_inner_mtype": mtypes})
 
+            # non-time levels of y_known do not change after construction,
+            # so their unique values are obtained once here, not in every predict;
+            # MultiIndex levels already hold unique values, once unused are removed
+            self._level_names = list(idx.names)
+            levels = idx.remove_unused_levels().levels
+            self._level_values = list(levels[:-1])
+            # codes of all combinations of non-time level values, in product order;
+            # only the time level changes between predict calls
+            level_sizes = [len(values) for values in self._level_values]
+            self._n_panels = int(np.prod(level_sizes))
+            self._panel_codes = list(
+                np.indices(level_sizes).reshape(len(level_sizes), -1)
+            )
+            # most recently used product index, keyed by number of horizon steps
+            self._fh_multi_cache = {}
+
+            # if y_known is the full product of its sorted levels, all instances
+            # share one time axis, and row positions follow from instance and time
+            is_product = len(idx) == self._n_panels * len(levels[-1])
+            is_product = is_product and self._y_known_is_unique
+            if is_product and all(lvl.is_monotonic_increasing for lvl in levels):
+                self._time_axis = levels[-1]
+
     def _fit(self, y, X, fh):
         """Fit forecaster to training data.
 
@@ -122,6 +224,11 @@ class ForecastKnownValues(BaseForecaster):
         self : reference to self
         """
         # no fitting, we already know the forecast values
+        # only remember the columns that predictions need to be aligned to
+        self._target_cols_ = y.columns
+        self._cols_match_ = self._y_known.columns.equals(y.columns)
+        # absolute horizon of the last predict, reused while fh and cutoff are same
+        self._fh_abs_cache_ = {}
         return self
 
     def _predict(self, fh, X=None):
@@ -139,42 +246,224 @@ class ForecastKnownValues(BaseForecaster):
         y_pred : pd.DataFrame
             Point predictions with MultiIndex for panel data.
         """
-        reindex_params = {"method": self.method, "limit": self.limit}
-        if self.fill_value is not None:
-            reindex_params["fill_value"] = self.fill_value
+        # Convert forecasting horizon to absolute indices,
+        # fh and cutoff are replaced, not mutated, so identity implies same fh_abs
+        cutoff = self.cutoff
+        fh_abs_cache = self._fh_abs_cache_
+        if fh_abs_cache.get("fh") is fh and fh_abs_cache.get("cutoff") is cutoff:
+            fh_abs = fh_abs_cache["fh_abs"]
+        else:
+            fh_abs = fh.to_absolute_index(cutoff)
+            fh_abs_cache.update(fh=fh, cutoff=cutoff, fh_abs=fh_abs)
 
-        # Convert forecasting horizon to absolute indices
-        fh_abs = fh.to_absolute_index(self.cutoff)
+        # flat index: the absolute horizon is already the index to play back
+        if not self._is_multiindex:
+            return self._reindex_known(fh_abs)
 
         # Ensure fh_abs is a MultiIndex matching y_known's structure
-        if isinstance(self._y_known.index, pd.MultiIndex):
-            levels = self._y_known.index.names
-            level_values = [self._y_known.index.get_level_values(lvl).unique() for lvl in levels[:-1]]
-            # Create all combinations of non-date levels with fh_abs dates
-            fh_multi = pd.MultiIndex.from_product(
-                level_values + [fh_abs], names=levels
-            )
+        n_fh = len(fh_abs)
+        fh_multi = self._fh_multi_cache.get(n_fh)
+        if fh_multi is None:
+            fh_multi = self._make_panel_multiindex(fh_abs)
+        else:
+            fh_level = fh_multi.levels[-1]
+            if fh_level.dtype != fh_abs.dtype or not fh_level.equals(fh_abs):
+                # same number of steps, e.g., after moving the cutoff:
+                # only the time level values change, the codes are shared
+                fh_multi = fh_multi.set_levels(fh_abs, level=-1, verify_integrity=False)
+        self._fh_multi_cache.clear()
+        self._fh_multi_cache[n_fh] = fh_multi
+
+        return self._reindex_known(fh_multi)
+
+    def _make_panel_multiindex(self, fh_abs):
+        """Create all combinations of non-time level values of y_known with fh_abs.
+
+        Equivalent to ``pd.MultiIndex.from_product`` of the non-time level values
+        and ``fh_abs``, but constructs the codes directly, since levels are known
+        to be unique and codes to be valid.
+
+        Parameters
+        ----------
+        fh_abs : pd.Index
+            absolute forecasting horizon, values of the time level
+
+        Returns
+        -------
+        fh_multi : pd.MultiIndex
+            product index with same level names as y_known
+        """
+        n_panels = self._n_panels
+        n_fh = len(fh_abs)
+
+        fh_codes = np.tile(np.arange(n_fh), n_panels)
+        if len(self._level_values) == 1:
+            # single instance level: its codes are the positions of instances
+            codes = [np.repeat(np.arange(n_panels), n_fh), fh_codes]
+        else:
+            codes = [np.repeat(level_codes, n_fh) for level_codes in self._panel_codes]
+            codes.append(fh_codes)
+
+        return pd.MultiIndex(
+            levels=self._level_values + [fh_abs],
+            codes=codes,
+            names=self._level_names,
+            verify_integrity=False,
+        )
+
+    def _reindex_known(self, index):
+        """Play back values of y_known at index, aligned to the columns of y.
+
+        Parameters
+        ----------
+        index : pd.Index
+            index to play back values of y_known at, of same type as y_known index
+
+        Returns
+        -------
+        y_pred : pd.DataFrame
+            values of y_known at index, with columns of y seen in fit
+        """
+        # columns of y seen in fit, bound once for all uses below
+        y_cols = self._target_cols_
+
+        # reindex fails on duplicate index labels, and filling by method fails
+        # if the time index of y_known cannot be ordered against the horizon
+        time_index = index.levels[-1] if self._is_multiindex else index
+        method_fails = self.method is not None and not _is_comparable(
+            self._y_known_time_index, time_index
+        )
+        if not self._y_known_is_unique or method_fails:
+            if not self._has_fill:
+                return pd.DataFrame(index=index, columns=y_cols)
+            return pd.DataFrame(self.fill_value, index=index, columns=y_cols)
+
+        # exact positions of rows in y_known, if all are found,
+        # method and fill_value play no role
+        if self._time_axis is not None:
+            indexer = self._panel_indexer(time_index)
+        else:
+            indexer = self._y_known.index.get_indexer(index)
+        if self._use_take:
+            y_pred = self._take_known(index, indexer)
+        elif (indexer >= 0).all():
+            y_pred = self._y_known.take(indexer)
+            y_pred.index = index
         else:
-            fh_multi = fh_abs
-
-        try:
-            # Reindex y_known to the full MultiIndex
-            y_pred = self._y_known.reindex(fh_multi, **reindex_params)
-            # If reindexing creates a single-level index, restore MultiIndex
-            if not isinstance(y_pred.index, pd.MultiIndex):
-                y_pred = y_pred.reindex(fh_multi, **reindex_params)
-            # Ensure columns match
-            y_pred = y_pred.reindex(columns=self._y.columns, **reindex_params)
-        except (TypeError, ValueError):
-            # Fallback if reindexing fails
-            if self.fill_value is None:
-                y_pred = pd.DataFrame(index=fh_multi, columns=self._y.columns)
+            y_pred = self._y_known.reindex(index, **self._reindex_params)
+
+        # Ensure columns match, method and limit only apply to rows
+        if not self._cols_match_:
+            fill_value = self.fill_value if self._has_fill else np.nan
+            y_pred = y_pred.reindex(columns=y_cols, fill_value=fill_value)
+
+        return y_pred
+
+    def _take_known(self, index, indexer):
+        """Reindex rows of y_known to index via integer take.
+
+        Equivalent to ``self._y_known.reindex(index, **params)``, with ``params``
+        being ``method``, ``limit`` and ``fill_value`` of ``self``,
+        if ``self._use_take`` is True and the index of ``y_known`` is unique,
+        but avoids the generic ``reindex`` machinery.
+
+        Parameters
+        ----------
+        index : pd.Index
+            index to obtain rows of y_known for
+        indexer : np.ndarray of int
+            positions of index in the index of y_known, as from ``get_indexer``
+            without method, -1 where an element of index is not in y_known
+
+        Returns
+        -------
+        y_pred : pd.DataFrame
+            rows of y_known at index, missing rows are filled with fill_value
+        """
+        values = self._y_known_values
+        shape = (len(index), values.shape[1])
+
+        found = indexer >= 0
+        if found.all():
+            return pd.DataFrame(
+                values.take(indexer, axis=0), index=index, columns=self._y_known_cols
+            )
+
+        # same indexer as reindex computes, limit is only valid with a method
+        if self.method is not None:
+            fh_abs = index.levels[-1] if self._is_multiindex else index
+            use_time_axis = (
+                self._time_axis is not None
+                and self.method in _SEARCHSORTED_METHODS
+                and self.limit is None
+                and fh_abs.dtype == self._time_axis.dtype
+            )
+            if use_time_axis:
+                indexer = self._panel_indexer(fh_abs, method=self.method)
             else:
-                y_pred = pd.DataFrame(
-                    self.fill_value, index=fh_multi, columns=self._y.columns
+                indexer = self._y_known.index.get_indexer(
+                    index, method=self.method, limit=self.limit
                 )
+            found = indexer >= 0
+        fill_value = self.fill_value if self._has_fill else np.nan
 
-        return y_pred
+        # numba supports only some float types, e.g., not float16 or longdouble
+        large = shape[0] * shape[1] >= _NUMBA_MIN_SIZE
+        use_numba = large and values.dtype in _NUMBA_DTYPES
+        if use_numba and _check_soft_dependencies("numba", severity="none"):
+            from sktime.forecasting._dummy_numba import _take_with_fill
+
+            out = np.empty(shape, dtype=values.dtype)
+            _take_with_fill(values, indexer, fill_value, out)
+        else:
+            out = np.full(shape, fill_value, dtype=values.dtype)
+            out[found] = values.take(indexer[found], axis=0)
+
+        return pd.DataFrame(out, index=index, columns=self._y_known_cols)
+
+    def _panel_indexer(self, fh_abs, method=None):
+        """Get positions in y_known of all instances at fh_abs, via shared time axis.
+
+        Requires y_known to be the full product of its sorted levels, i.e.,
+        ``self._time_axis`` not None, so a single search on the time axis
+        gives the positions for all instances.
+
+        Equivalent to ``get_indexer`` of the y_known index, with the product
+        of instances and ``fh_abs`` as target. With a fill method, this includes
+        the lexicographic ordering of the MultiIndex, e.g., for ``method="pad"``
+        a time before the start of an instance maps to the last row of the
+        previous instance.
+
+        Parameters
+        ----------
+        fh_abs : pd.Index
+            absolute forecasting horizon, values of the time level
+        method : None, "pad"/"ffill" or "backfill"/"bfill", optional, default=None
+            method to use for time points not in y_known
+
+        Returns
+        -------
+        indexer : np.ndarray of int
+            positions in y_known of the product of instances and fh_abs,
+            in product order, -1 where no row is found
+        """
+        time_axis = self._time_axis
+        n_time = len(time_axis)
+
+        if method is None:
+            pos = time_axis.get_indexer(fh_abs)
+        elif method in ["pad", "ffill"]:
+            pos = time_axis.searchsorted(fh_abs, side="right") - 1
+        else:
+            pos = time_axis.searchsorted(fh_abs, side="left")
+
+        indexer = np.arange(self._n_panels)[:, None] * n_time + pos
+        if method is None:
+            indexer[:, pos < 0] = -1
+        else:
+            indexer[(indexer < 0) | (indexer >= len(self._y_known))] = -1
+
+        return indexer.ravel()
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -204,4 +493,4 @@ class ForecastKnownValues(BaseForecaster):
         params1 = {"y_known": y, "fill_value": 42}
         params2 = {"y_known": y2, "method": "ffill", "limit": 3, "fill_value": 42}
 
-        return [params1, params2]
\ No newline at end of file
+        return [params1, params2]
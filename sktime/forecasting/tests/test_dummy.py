@@ -0,0 +1,114 @@
+"""Tests for dummy forecasters."""
+
+__author__ = ["aryan0931"]
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.forecasting.base import ForecastingHorizon
+from sktime.forecasting.dummy import ForecastKnownValues
+from sktime.tests.test_switch import run_test_for_class, run_test_module_changed
+from sktime.utils._testing.hierarchical import _make_hierarchical
+from sktime.utils._testing.series import _make_series
+from sktime.utils.dependencies import _check_soft_dependencies
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ForecastKnownValues),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+@pytest.mark.parametrize("hierarchy_levels", [None, (3,), (2, 2)])
+@pytest.mark.parametrize(
+    "method, fill_value",
+    [(None, None), (None, 42), ("ffill", None), ("bfill", 42)],
+)
+def test_forecast_known_values_equals_reindex(hierarchy_levels, method, fill_value):
+    """Test that ForecastKnownValues plays back y_known as pandas reindex does.
+
+    Regression test for the playback of values in ``_predict``: the forecast must
+    equal ``y_known`` reindexed to the expected prediction index, with same index
+    type, including at horizons beyond the end of ``y_known``.
+    """
+    if hierarchy_levels is None:
+        y_known = _make_series(n_columns=2, n_timepoints=20, random_state=0)
+        y_train = y_known.iloc[:12]
+    else:
+        y_known = _make_hierarchical(
+            hierarchy_levels=hierarchy_levels,
+            min_timepoints=20,
+            max_timepoints=20,
+            n_columns=2,
+            random_state=0,
+        )
+        y_known = y_known.iloc[::2]
+        inst_levels = list(range(len(hierarchy_levels)))
+        y_train = y_known.groupby(level=inst_levels).head(6)
+
+    fh = ForecastingHorizon([1, 2, 3, 9], freq="D")
+    forecaster = ForecastKnownValues(y_known, method=method, fill_value=fill_value)
+    forecaster.fit(y_train, fh=fh)
+    y_pred = forecaster.predict()
+
+    expected_idx = fh.get_expected_pred_idx(y_train, cutoff=forecaster.cutoff)
+    reindex_params = {"method": method}
+    if fill_value is not None:
+        reindex_params["fill_value"] = fill_value
+    y_expected = y_known.reindex(expected_idx, **reindex_params)
+
+    assert isinstance(y_pred.index, type(y_known.index))
+    pd.testing.assert_frame_equal(y_pred, y_expected)
+
+    # repeated predict, served from cached indices, gives the same result
+    pd.testing.assert_frame_equal(forecaster.predict(), y_expected)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(ForecastKnownValues),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_forecast_known_values_unsorted_instances():
+    """Test that forecasts of y_known with unsorted instances are in sorted order.
+
+    ``y_known`` is sorted on construction, so the rows of the forecast follow the
+    sorted instance order, not the order of instances in ``y_known``.
+    """
+    time_index = pd.date_range("2000-01-01", periods=10, freq="D")
+    index = pd.MultiIndex.from_product([["b", "a"], time_index])
+    y_known = pd.DataFrame({"x": np.arange(20.0)}, index=index)
+    y_train = y_known.groupby(level=0, sort=False).head(5)
+
+    fh = ForecastingHorizon([1, 2], freq="D")
+    forecaster = ForecastKnownValues(y_known)
+    forecaster.fit(y_train, fh=fh)
+    y_pred = forecaster.predict()
+
+    expected_idx = pd.MultiIndex.from_product([["a", "b"], time_index[5:7]])
+    y_expected = pd.DataFrame({"x": [15.0, 16.0, 5.0, 6.0]}, index=expected_idx)
+    pd.testing.assert_frame_equal(y_pred, y_expected)
+
+
+@pytest.mark.skipif(
+    not run_test_module_changed(["sktime.forecasting._dummy_numba"])
+    or not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("fill_value", [np.nan, 42, 0.5])
+def test_take_with_fill(dtype, fill_value):
+    """Test numba row take against numpy take, with missing rows filled."""
+    from sktime.forecasting._dummy_numba import _take_with_fill
+
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(20, 3)).astype(dtype)
+    indexer = rng.integers(-1, 20, size=50)
+    indexer[[0, 7, 49]] = -1
+
+    out = np.empty((len(indexer), values.shape[1]), dtype=dtype)
+    _take_with_fill(values, indexer, fill_value, out)
+
+    found = indexer >= 0
+    expected = np.full(out.shape, fill_value, dtype=dtype)
+    expected[found] = values.take(indexer[found], axis=0)
+
+    np.testing.assert_array_equal(out, expected)